@@ -8,54 +8,78 @@ This module provides the fundamental classes for parsing and transforming LaTeX
 
 from __future__ import annotations
 import logging
-from typing import Optional, Dict
+import re
+from bisect import bisect_left
+from typing import Callable, Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
+# Characters that interrupt plain text and need dispatching
+_SPECIAL_RE = re.compile(r"[\\{}$%~]")
+
+# Every line boundary str.splitlines() recognises, normalised to "\n" first so
+# the comment pattern below only has to deal with one kind of line break
+_LINE_BREAK_RE = re.compile(r"\r\n?|[\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
+# Whole lines whose first non-blank character is %, including their newline
+_COMMENT_RE = re.compile(r"^[^\S\n]*%.*\n?", re.MULTILINE)
+
 
 class Node:
     """Represents a chunk of LaTeX source text with position tracking.
 
     This class manages a text buffer with an index pointer that tracks the current
     parsing position. It automatically filters out LaTeX comment lines (starting with %)
-    during initialization and caches positions of special characters for efficient lookup.
+    during initialization and records the offsets of all special characters up front,
+    so the next one is found by advancing a cursor through that list.
 
     Attributes:
         _text: The complete text content (immutable)
         _index: Current parsing position
-        root: Optional parent node for stack-based inclusion
-        symbols: Cache of special character positions
+        _specials: Sorted offsets of every special character in _text
+        _cursor: Position in _specials of the last special character returned
+        _text_cache: Last tail slice returned by ``text``
+        _text_cache_idx: Index the cached slice was taken at
     """
 
-    def __init__(self, text: str, root: Optional[Node] = None) -> None:
+    __slots__ = (
+        "_text", "_specials", "_cursor", "_index", "_text_cache", "_text_cache_idx"
+    )
+
+    def __init__(self, text: str) -> None:
         """Initialize a Node with LaTeX text, filtering comment lines.
 
         Args:
             text: LaTeX source text to parse
-            root: Optional parent node (for file inclusion stack)
         """
-        # Filter out comment lines (starting with %)
-        self._text = (
-            "\n".join(
-                filter(lambda x: not x.lstrip().startswith("%"), text.splitlines())
-            )
-            + "\n"
-        )
+        # Filter out comment lines (starting with %) in a single regex pass
+        text = _COMMENT_RE.sub("", _LINE_BREAK_RE.sub("\n", text))
+        if not text.endswith("\n"):
+            text += "\n"
+        self._text = text
+        # One C-level pass; keeps str offsets exact even for non-ASCII text
+        self._specials = [m.start() for m in _SPECIAL_RE.finditer(text)]
+        self._cursor = 0
         self._index = 0
-        self.root = root
-        # Cache for special character positions (optimization)
-        self.symbols: Dict[str, int] = {
-            "\\": -1, "{": -1, "}": -1, "$": -1, "%": -1, "~": -1
-        }
+        # Tail slice reused until the index moves
+        self._text_cache = ""
+        self._text_cache_idx = -1
 
     @property
     def text(self) -> str:
         """Return the text from the current index onward.
 
+        The slice is cached until the index moves, so repeated reads at the same
+        position share one copy. Hot paths should still scan ``_text`` from
+        ``_index`` instead of going through this property.
+
         Returns:
             Substring from current index to end
         """
-        return self._text[self.index:]
+        if self._text_cache_idx != self._index:
+            self._text_cache = self._text[self._index:]
+            self._text_cache_idx = self._index
+        return self._text_cache
 
     @text.setter
     def text(self, text: str) -> None:
@@ -99,27 +123,54 @@ class Node:
     def inter(self) -> int:
         """Find distance to the next special character.
 
-        This property efficiently finds the closest special character (\\, {, }, $, %, ~)
-        by maintaining a cache of their positions. Only recomputes positions that are
-        behind the current index.
+        This property finds the closest special character (\\, {, }, $, %, ~)
+        by bisecting the precomputed offsets from the cursor onward. The index
+        never moves backwards, so the cursor only ever advances.
 
         Returns:
             Distance to next special character, or -1 if none found
         """
-        # Update cached positions for symbols behind current index
-        for symbol in list(self.symbols.keys()):
-            if self.symbols[symbol] < self.index:
-                if symbol not in self.text:
-                    # Symbol no longer exists in remaining text
-                    self.symbols.pop(symbol)
-                else:
-                    # Update cached position
-                    self.symbols[symbol] = self._text.find(symbol, self.index)
-
-        # Return distance to closest symbol
-        if any(self.symbols):
-            return min(self.symbols.values()) - self.index
-        return -1
+        specials = self._specials
+        self._cursor = cursor = bisect_left(specials, self._index, self._cursor)
+        if cursor == len(specials):
+            return -1
+        return specials[cursor] - self._index
+
+    def drop_text_cache(self) -> None:
+        """Release the cached tail slice returned by ``text``.
+
+        The next read of ``text`` slices the buffer afresh.
+        """
+        self._text_cache = ""
+        self._text_cache_idx = -1
+
+    def peek(self) -> str:
+        """Return the character at the current index without copying the tail.
+
+        Returns:
+            Current character, or an empty string at the end of the text
+        """
+        if self._index >= len(self._text):
+            return ""
+        return self._text[self._index]
+
+    def try_move_index(self, text_to_find: str) -> bool:
+        """Search for text and move index to the end of it if present.
+
+        Non-raising variant of move_index for optional syntax, where a missing
+        pattern is a normal outcome rather than an error.
+
+        Args:
+            text_to_find: Text pattern to search for
+
+        Returns:
+            True if the index moved, False if text_to_find was not found
+        """
+        pos = self._text.find(text_to_find, self._index)
+        if pos == -1:
+            return False
+        self.index = pos + len(text_to_find)
+        return True
 
     def move_index(self, text_to_find: str) -> None:
         """Search for text and move index to the end of it.
@@ -130,12 +181,10 @@ class Node:
         Raises:
             ValueError: If text_to_find is not found
         """
-        pos = self._text.find(text_to_find, self.index)
-        if pos == -1:
+        if not self.try_move_index(text_to_find):
             logger.error("Could not find '%s' in text starting at index %d",
                         text_to_find[:50], self.index)
             raise ValueError(f"Text pattern not found: {text_to_find[:50]}")
-        self.index = pos + len(text_to_find)
 
 
 class Source:
@@ -152,7 +201,7 @@ class Source:
     - Pop stack when done, resume main.tex
 
     Attributes:
-        head: The current (top of stack) Node being processed
+        _stack: Nodes being processed, innermost inclusion last
     """
 
     def __init__(self, text: str) -> None:
@@ -161,7 +210,16 @@ class Source:
         Args:
             text: Initial LaTeX source text
         """
-        self.head: Optional[Node] = Node(text)
+        self._stack: list[Node] = [Node(text)]
+
+    @property
+    def head(self) -> Optional[Node]:
+        """Get the current (top of stack) Node being processed.
+
+        Returns:
+            Top node, or None once the stack is exhausted
+        """
+        return self._stack[-1] if self._stack else None
 
     # Proxy properties to head node for convenient access
     @property
@@ -234,6 +292,35 @@ class Source:
             raise AttributeError("Source stack is empty")
         return self.head.inter
 
+    def peek(self) -> str:
+        """Get the current character from head node.
+
+        Returns:
+            Current character, or an empty string at the end of the text
+
+        Raises:
+            AttributeError: If head is None (stack exhausted)
+        """
+        if self.head is None:
+            raise AttributeError("Source stack is empty")
+        return self.head.peek()
+
+    def try_move_index(self, text_to_find: str) -> bool:
+        """Search for text in head node and move index past it if present.
+
+        Args:
+            text_to_find: Text pattern to find
+
+        Returns:
+            True if the index moved, False if text_to_find was not found
+
+        Raises:
+            AttributeError: If head is None (stack exhausted)
+        """
+        if self.head is None:
+            raise AttributeError("Source stack is empty")
+        return self.head.try_move_index(text_to_find)
+
     def move_index(self, text_to_find: str) -> None:
         """Search for text in head node and move index past it.
 
@@ -252,28 +339,32 @@ class Source:
         """Push new text onto stack (for file inclusion).
 
         Creates a new Node with the given text and pushes it onto the stack,
-        making it the new head. The previous head becomes the new node's parent.
+        making it the new head. The previous head resumes once it is popped;
+        its cached tail slice is dropped first, since the index will have moved
+        by then and the copy would only pin memory while the inclusion runs.
 
         Args:
             text: New LaTeX source text to process
         """
-        self.head = Node(text, self.head)
+        if self._stack:
+            self._stack[-1].drop_text_cache()
+        self._stack.append(Node(text))
         logger.debug("Pushed new text onto source stack (length: %d)", len(text))
 
     def pop(self) -> None:
         """Pop current node from stack.
 
-        Removes the current head node and restores its parent as the new head.
+        Removes the current head node and restores the previous one as the new head.
         Used when finished processing an included file.
 
         Raises:
-            RuntimeError: If attempting to pop when no parent exists
+            RuntimeError: If attempting to pop from an empty stack
         """
-        if self.head is None:
+        if not self._stack:
             raise RuntimeError("Cannot pop from empty source stack")
-        if self.head.root is None:
+        if len(self._stack) == 1:
             logger.warning("Popping last node from source stack")
-        self.head = self.head.root
+        self._stack.pop()
         logger.debug("Popped node from source stack")
 
 
@@ -286,27 +377,24 @@ class Clean:
 
     The accumulator pattern allows incremental text building without repeated
     string concatenation (which would be O(n²)). Instead, fragments are stored
-    and joined once when needed (O(n)).
+    and joined once when needed (O(n)). The joined string replaces the
+    fragments in place, so later reads are free and later adds extend it.
 
     Attributes:
-        _text: List of text fragments (private)
+        _chunks: List of text fragments (private)
+        add: Append a fragment of cleaned text; bound directly to the list's
+            ``append`` so each call skips a Python-level method frame
         aggro: Set of unknown command names encountered
     """
 
     def __init__(self) -> None:
         """Initialize empty accumulator."""
-        self._text: list[str] = []
+        self._chunks: list[str] = []
+        # The list is only ever mutated in place, so this binding stays valid
+        self.add: Callable[[str], None] = self._chunks.append
         # Set of unknown commands (for diagnostic output)
         self.aggro: set[str] = set()
 
-    def add(self, text: str) -> None:
-        """Add a fragment of cleaned text to the accumulator.
-
-        Args:
-            text: Text fragment to append
-        """
-        self._text.append(text)
-
     @property
     def text(self) -> str:
         """Get the complete assembled text.
@@ -317,12 +405,12 @@ class Clean:
         Returns:
             Complete cleaned text as single string
         """
-        if len(self._text) == 0:
+        if not self._chunks:
             return ""
-        if len(self._text) > 1:
+        if len(self._chunks) > 1:
             # Join fragments and cache result
-            self._text = ["".join(self._text)]
-        return self._text[0]
+            self._chunks[:] = ["".join(self._chunks)]
+        return self._chunks[0]
 
     @text.setter
     def text(self, text: str) -> None:
@@ -333,11 +421,27 @@ class Clean:
         Args:
             text: New text to replace accumulated content
         """
-        self._text = [text]
+        self._chunks[:] = [text]
+
+    def iter_chunks(self, size: int = 1 << 20) -> Iterator[str]:
+        """Yield the assembled text in slices of bounded length.
+
+        Lets callers stream the text to a file without the file layer encoding
+        the whole document into one bytes object at once.
+
+        Args:
+            size: Maximum number of characters per slice
+
+        Yields:
+            Consecutive slices of the complete cleaned text
+        """
+        text = self.text
+        for start in range(0, len(text), size):
+            yield text[start:start + size]
 
     def clear(self) -> None:
         """Clear all accumulated text and unknown commands."""
-        self._text = []
+        self._chunks.clear()
         self.aggro = set()
 
     def __len__(self) -> int:
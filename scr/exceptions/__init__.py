@@ -19,6 +19,28 @@ logger = logging.getLogger(__name__)
 # ----------------------------------------
 
 
+def _match_bracket(s: str, i: int, opener: str, closer: str) -> int:
+    """return the index just past the closer matching the opener at s[i], or len(s) if unbalanced
+
+    jumps between bracket occurrences with str.find so the text in between is
+    scanned in C rather than one character per loop iteration
+    """
+    depth = 1
+    i += 1
+    while depth:
+        close = s.find(closer, i)
+        if close == -1:
+            return len(s)
+        nested = s.find(opener, i, close)
+        if nested == -1:
+            depth -= 1
+            i = close + 1
+        else:
+            depth += 1
+            i = nested + 1
+    return i
+
+
 def _reprint(env) -> None:
     """add the command to env.clean the command"""
     env.clean.add(env.command)
@@ -38,22 +60,22 @@ def _curly_curly(env) -> None:
 def _color(env) -> None:
     """add color to env.source and move to the end of curly brackets"""
     env.clean.add("Color:")
-    i = env.source.text.find("}")
-    env.clean.add(env.source.text[1:i].upper())
-    env.source.index += i + 1
+    head = env.source.head
+    start = head._index
+    i = head._text.find("}", start)
+    env.clean.add(head._text[start + 1 : i].upper())
+    head.index = i + 1
 
 
 def _footnote(env) -> None:
     """add footnote to env.source and move to the end of nested curly brackets"""
-    i = 1
-    j = i  # index for open brackets
-    while i >= j and j > 0:
-        i = env.source.text.find("}", i) + 1
-        j = env.source.text.find("{", j) + 1
+    head = env.source.head
+    s, start = head._text, head._index
+    i = _match_bracket(s, start, "{", "}")  # just past the matching }
 
     # add the text in the footnote to the queue in parenthesis
-    env.source.add("(FOOTNOTE: " + env.source.text[1 : i - 1] + ")")
-    env.source.head.root.index += i
+    env.source.add("(FOOTNOTE: " + s[start + 1 : i - 1] + ")")
+    head.index = i
 
 
 def _include(env) -> None:
@@ -65,13 +87,15 @@ def _include(env) -> None:
     Args:
         env: Processing environment
     """
-    i = env.source.text.find("}")
-    include_path_str = env.source.text[1:i]
+    head = env.source.head
+    start = head._index
+    i = head._text.find("}", start)
+    include_path_str = head._text[start + 1 : i]
 
     # Skip bibliography files
     if include_path_str.endswith(".bbl"):
         logger.debug("Skipping bibliography file: %s", include_path_str)
-        env.source.index += i + 1
+        head.index = i + 1
         return
 
     # Auto-append .tex extension
@@ -82,25 +106,22 @@ def _include(env) -> None:
     include_path = env.folder_path / include_path_str
 
     try:
-        # Check if file exists
-        if not include_path.exists():
-            logger.warning("Included file not found: %s", include_path)
-            env.source.head.root.index += i + 1
-            env.clean.add(f"[FILE NOT FOUND: {include_path_str}]")
-            return
-
-        # Load and push file content
-        with open(include_path, encoding="utf-8") as include_tex:
-            content = include_tex.read()
-            env.source.add(content)
-            logger.debug("Included file: %s (%d bytes)", include_path, len(content))
-
-        env.source.head.root.index += i + 1
-
-    except IOError as e:
+        # Load and push file content in one read
+        content = include_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        logger.warning("Included file not found: %s", include_path)
+        head.index = i + 1
+        env.clean.add(f"[FILE NOT FOUND: {include_path_str}]")
+        return
+    except OSError as e:
         logger.error("Failed to read included file %s: %s", include_path, e)
-        env.source.head.root.index += i + 1
+        head.index = i + 1
         env.clean.add(f"[ERROR READING: {include_path_str}]")
+        return
+
+    env.source.add(content)
+    logger.debug("Included file: %s (%d bytes)", include_path, len(content))
+    head.index = i + 1
 
 
 def _print_curly(env) -> None:
@@ -112,7 +133,7 @@ def _print_curly(env) -> None:
 def _print_square_curly(env) -> None:
     """add [_] for env.clean and move to the end of square if present, and then curly brackets"""
     env.clean.add("[_]")
-    if env.source.text[0] == "[":
+    if env.source.peek() == "[":
         env.source.move_index("]")
     env.source.move_index("}")
 
@@ -122,8 +143,9 @@ from exceptions import sub_begin
 
 def _begin(env) -> None:
     """responds to the command being and move to the function begin and its subroutines"""
-    i = env.source.text.find("}")  # right next after the brackets
-    env.command = env.source.text[1:i]  # remove asterisk if any
+    head = env.source.head
+    i = head._text.find("}", head._index)  # right next after the brackets
+    env.command = head._text[head._index + 1 : i]  # remove asterisk if any
     env.source.move_index("}")
     sub_begin.interpret(env)
 
@@ -133,8 +155,9 @@ from exceptions import sub_end
 
 def _end(env) -> None:
     """responds to the command end and move to the function end and its subroutines"""
-    i = env.source.text.find("}")
-    env.command = env.source.text[1:i]
+    head = env.source.head
+    i = head._text.find("}", head._index)
+    env.command = head._text[head._index + 1 : i]
     env.source.move_index("}")
     sub_end.interpret(env)
 
@@ -145,46 +168,53 @@ def _end(env) -> None:
 def _new_line(env) -> None:
     """add a new line to env.clean and skip optional spacing argument"""
     env.clean.add("\n")
-    env.source.index += 1
+    head = env.source.head
+    head.index = head._index + 1
     # Check for optional spacing argument: \\[spacing]
-    if env.source.text and env.source.text[0] == "[":
-        try:
-            env.source.move_index("]")
-        except ValueError:
-            # If no closing bracket found, just continue
-            pass
+    if head.peek() == "[":
+        # If no closing bracket found, just continue
+        head.try_move_index("]")
 
 
 def _square_equation(env) -> None:
     r"""add [_] when meeting an equation called via \[ and move index to the end if it"""
-    i = env.source.text.find("\\]")
+    head = env.source.head
+    i = head._text.find("\\]", head._index)
     env.clean.add("[_]")
-    if env.source.text[:i].rstrip()[-1] in [
+    body = head._text[head._index : i].rstrip()
+    if body[-1] in [
         ",",
         ";",
         ".",
     ]:  # add punctuation to non-inline equations
-        env.clean.add(env.source.text[:i].rstrip()[-1])
+        env.clean.add(body[-1])
     env.source.move_index("\\]")
 
 
 def _round_equation(env) -> None:
     r"""add [_] when meeting an equation called via \( and move index to the end if it"""
-    i = env.source.text.find("\\)")
+    head = env.source.head
+    i = head._text.find("\\)", head._index)
     env.clean.add("[_]")
-    if env.source.text[:i].rstrip()[-1] in [
+    body = head._text[head._index : i].rstrip()
+    if body[-1] in [
         ",",
         ";",
         ".",
     ]:  # add punctuation to non-inline equations
-        env.clean.add(env.source.text[:i].rstrip()[-1])
+        env.clean.add(body[-1])
     env.source.move_index("\\)")
 
 
+_VOWELS = frozenset("aeiou")
+
+
 def _apostrofe(env) -> None:
     """skip letter when meeting an apostrofe"""
-    if env.source.text[1] in ("a", "e", "i", "o", "u"):
-        env.source.index += 1
+    head = env.source.head
+    i = head._index + 1
+    if i < len(head._text) and head._text[i] in _VOWELS:
+        head.index = i
 
 
 def _tilde(env) -> None:
@@ -297,6 +327,15 @@ special_commands = {
     "~": _tilde,
 }
 
+# single lookup table built once at import: custom routines take precedence over
+# built-in ones, and void commands over both (they map to the null function)
+_VOID = frozenset(void) | frozenset(void_c)
+_DISPATCH = {
+    **dic_commands,
+    **dic_commands_c,
+    **dict.fromkeys(_VOID, _null_function),
+}
+
 # ----------------------------------------
 # INTERPRETER
 # ----------------------------------------
@@ -304,40 +343,31 @@ special_commands = {
 
 def interpret(env) -> None:
     """this is the custom interpreter that recalls first custom subroutines, then built-in subroutines and then skip the command if not recognised"""
-    if env.command:
-        if env.command in void or env.command in void_c:
-            pass
-        elif env.command in dic_commands_c:
-            dic_commands_c[env.command](env)
-        elif env.command in dic_commands:
-            dic_commands[env.command](env)
+    cmd = env.command
+    if cmd:
+        fn = _DISPATCH.get(cmd)
+        if fn is not None:
+            fn(env)
         else:
-            while env.source.text[0] in [
-                "{",
-                "[",
-            ]:  # check if opening and closing brackets
-                if env.source.text[0] == "{":
-                    i = env.source.text.find("{", 1)
-                    j = env.source.text.find("}", 1)
-                    while 0 < i < j:
-                        i = env.source.text.find("{", i + 1)
-                        j = env.source.text.find("}", j + 1)
-                    env.source.index += j + 1
+            head = env.source.head
+            s, i = head._text, head._index
+            # skip every following {...} or [...] argument, honouring nesting
+            while i < len(s) and s[i] in "{[":
+                if s[i] == "{":
+                    i = _match_bracket(s, i, "{", "}")
                 else:
-                    i = env.source.text.find("[", 1)
-                    j = env.source.text.find("]", 1)
-                    while 0 < i < j:
-                        i = env.source.text.find("[", i + 1)
-                        j = env.source.text.find("]", j + 1)
-                    env.source.index += j + 1
-            env.clean.aggro.add(env.command)
+                    i = _match_bracket(s, i, "[", "]")
+            head.index = i
+            env.clean.aggro.add(cmd)
     else:  # empty string
-        env.command = env.source.text[0]
-        if env.command in special_commands:
-            special_commands[env.command](env)
+        head = env.source.head
+        env.command = c = head.peek()
+        fn = special_commands.get(c)
+        if fn is not None:
+            fn(env)
         else:
             env.clean.add(" ")
-            env.source.index += 1
+            head.index = head._index + 1
 
 
 # ----------------------------------------
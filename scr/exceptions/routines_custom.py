@@ -14,7 +14,7 @@ def _print_curly(env) -> None:
 def _print_square_curly(env) -> None:
     """add [_] for CLEAN and move to the end of square if present, and then curly brackets"""
     env.clean.add("[_]")
-    if env.source.text[0] == "[":
+    if env.source.peek() == "[":
         env.source.move_index("]")
     env.source.move_index("}")
 
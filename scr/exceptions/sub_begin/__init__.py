@@ -4,6 +4,16 @@
 # BULTI-IN FUNCTIONS
 # ----------------------------------------
 
+_END_CACHE: dict[str, str] = {}
+
+
+def _end_sentinel(name: str) -> str:
+    """return the \\end{name} string for an environment, built once per name"""
+    s = _END_CACHE.get(name)
+    if s is None:
+        s = _END_CACHE[name] = "\\end{" + name + "}"
+    return s
+
 
 def _title(env) -> None:
     """add title to env.clean"""
@@ -13,37 +23,45 @@ def _title(env) -> None:
 def _equation(env) -> None:
     """add [_] and move to the end of the equation command"""
     env.clean.add("[_]")
-    # find the index where the whole portion ends
-    i = env.source.text.find("\\end{" + env.command + "}")  # from here, use regex
-    if env.source.text[: i - 1].rstrip()[-1] in [",", ";", "."]:
-        env.clean.add(env.source.text[: i - 1].rstrip()[-1])
-    env.source.move_index("\\end{" + env.command + "}")
+    sentinel = _end_sentinel(env.command)
+    head = env.source.head
+    start = head._index
+    # find the index where the whole portion ends, scanning the buffer once
+    i = head._text.find(sentinel, start)
+    if i == -1:
+        env.source.move_index(sentinel)  # reports the unclosed environment
+    body = head._text[start : i - 1].rstrip()
+    if body and body[-1] in [",", ";", "."]:
+        env.clean.add(body[-1])
+    head.index = i + len(sentinel)
 
 
 def _enumerate(env) -> None:
     """add a new node to env.source, replacing item with . followed by a new number"""
-    if env.source.text[0] == "[":
+    if env.source.peek() == "[":
         env.source.move_index("]")
-    i = env.source.text.find("\\end{enumerate}")
-    new_text = env.source.text[:i]
+    head = env.source.head
+    i = head._text.find("\\end{enumerate}", head._index)
+    new_text = head._text[head._index : i]
     index_enum = 1
     while "\\item" in new_text:
         new_text = new_text.replace("\\item", str(index_enum) + ".", 1)
         index_enum += 1
 
+    env.source.move_index("\\end{enumerate}")
     env.source.add(new_text)
-    env.source.head.root.move_index("\\end{enumerate}")
 
 
 def _itemize(env) -> None:
     """add a new node to env.source, replacing item with -"""
-    if env.source.text[0] == "[":
+    if env.source.peek() == "[":
         env.source.move_index("]")
-    i = env.source.text.find("\\end{itemize}")
-    new_text = env.source.text[:i].replace("\\item", "-")
+    head = env.source.head
+    i = head._text.find("\\end{itemize}", head._index)
+    new_text = head._text[head._index : i].replace("\\item", "-")
 
+    env.source.move_index("\\end{itemize}")
     env.source.add(new_text)
-    env.source.head.root.move_index("\\end{itemize}")
 
 
 def _curly_curly(env) -> None:
@@ -60,7 +78,7 @@ def _curly_curly_curly(env) -> None:
 
 def _skip(env) -> None:
     """skip command when not recognised"""
-    env.source.move_index("\\end{" + env.command + "}")
+    env.source.move_index(_end_sentinel(env.command))
 
 
 # ----------------------------------------
@@ -121,10 +139,17 @@ def interpret(env) -> None:
     elif env.command in dic_commands:
         dic_commands[env.command](env)
     else:
-        i = env.source.text.find("\\begin{" + env.command + "}", 6)
-        j = env.source.text.find("\\end{" + env.command + "}", 6)
-        while 0 < i < j:  # in case the class is nested
-            i = env.source.text.find("\\begin{" + env.command + "}", i + 6)
-            j = env.source.text.find("\\end{" + env.command + "}", j + 6)
-        env.source.index += j + 5 + len(env.command)
+        # match nested environments of the same kind on the head buffer by offset
+        head = env.source.head
+        s, start = head._text, head._index
+        begin = "\\begin{" + env.command + "}"
+        end = _end_sentinel(env.command)
+        i = s.find(begin, start + 6)
+        j = s.find(end, start + 6)
+        while start < i < j:  # in case the class is nested
+            i = s.find(begin, i + 6)
+            j = s.find(end, j + 6)
+        if j == -1:  # unclosed: only the environment name is skipped, as before
+            j = start - 1
+        head.index = j + 5 + len(env.command)
         env.clean.aggro.add("begin{" + env.command + "}")
@@ -18,22 +18,26 @@ def _thm(env) -> None:
 def _equation(env) -> None:
     """add [_] and move to the end of the equation command"""
     env.clean.add("[_]")
-    # find the index where the whole portion ends
-    i = env.source.text.find("\\end{" + env.command + "}")
-    if i > 0 and env.source.text[: i - 1].rstrip() and env.source.text[: i - 1].rstrip()[-1] in [",", ";", "."]:
-        env.clean.add(env.source.text[: i - 1].rstrip()[-1])
-    env.source.move_index("\\end{" + env.command + "}")
+    sentinel = "\\end{" + env.command + "}"
+    head = env.source.head
+    start = head._index
+    # find the index where the whole portion ends, scanning the buffer once
+    i = head._text.find(sentinel, start)
+    if i == -1:
+        env.source.move_index(sentinel)  # reports the unclosed environment
+    body = head._text[start : i - 1].rstrip()
+    if body and body[-1] in [",", ";", "."]:
+        env.clean.add(body[-1])
+    head.index = i + len(sentinel)
 
 
 def _skip_optional_brackets(env) -> None:
     """transparent environment that skips optional [] parameters"""
     # Check for optional parameters: \begin{env}[options]
-    if env.source.text and env.source.text[0] == "[":
-        try:
-            env.source.move_index("]")
-        except ValueError:
-            # If no closing bracket found, just continue
-            pass
+    head = env.source.head
+    if head.peek() == "[":
+        # If no closing bracket found, just continue
+        head.try_move_index("]")
 
 
 # ----------------------------------------
@@ -5,7 +5,6 @@ LaTeX documents to clean text suitable for grammar checking tools like Grammarly
 """
 
 import sys
-import argparse
 import re
 import logging
 from pathlib import Path
@@ -14,18 +13,8 @@ from typing import Optional
 from classes import Source, Clean
 from exceptions import interpret
 
-try:
-    import pyle_manager  # type: ignore
-    HAS_FILE_PICKER = True
-except ImportError:
-    HAS_FILE_PICKER = False
-    logging.warning("File picker not available - pyle_manager import failed")
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(levelname)s: %(message)s'
-)
+# Logging is configured in main() once the requested level is known
+LOG_FORMAT = '%(levelname)s: %(message)s'
 logger = logging.getLogger(__name__)
 
 
@@ -53,12 +42,13 @@ class Environment:
             FileNotFoundError: If file doesn't exist
             IOError: If file cannot be read
         """
-        if not file_path.exists():
-            raise FileNotFoundError(f"LaTeX file not found: {file_path}")
-
+        # No separate exists() check: the read itself reports a missing file,
+        # so a path already validated by select_file is only stat'ed once
         try:
-            with open(file_path, encoding="utf-8") as source_file:
-                self.source = Source(source_file.read())
+            # Decoded in one read, the same way included files are loaded
+            self.source = Source(file_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"LaTeX file not found: {file_path}") from None
         except IOError as e:
             raise IOError(f"Failed to read file {file_path}: {e}") from e
 
@@ -75,14 +65,21 @@ COMMAND_TERMINATORS = (
     "$", "\\", "\n", '"', "'", "~"
 )
 
-# Compiled regex patterns (for performance)
-REGEX_PATTERNS = {
-    'trailing_spaces': re.compile(r"( )*\n( )*"),
-    'excess_newlines': re.compile(r"\n\n\s*"),
-    'double_spacing': re.compile(r"( )+"),
-    'equation_before': re.compile(r"(\S)\n?(?<!-)\[_\]"),
-    'equation_after': re.compile(r"\[_\](\.|,|;)?\n(?!(?:\d+\.|-))(\S)"),
-}
+# Matches any command terminator, so the nearest one is found in a single scan
+CMD_TERM_RE = re.compile("[" + re.escape("".join(COMMAND_TERMINATORS)) + "]")
+
+# Compiled regex patterns (for performance), bound to module names so the
+# per-run whitespace callback does not pay a dict lookup for each pattern
+
+# "[]" and "()" in one pass; "(" + removed "[]" pairs + ")" is matched whole because
+# dropping the "[]" pairs first used to leave a "()" that was then removed too
+EMPTY_BRACKETS_RE = re.compile(r"\((?:\[\])*\)|\[\]")
+WHITESPACE_RUN_RE = re.compile(r"\s{2,}")
+TRAILING_SPACES_RE = re.compile(r" *\n *")
+EXCESS_NEWLINES_RE = re.compile(r"\n\n\s*")
+DOUBLE_SPACING_RE = re.compile(r" {2,}")
+EQUATION_BEFORE_RE = re.compile(r"(\S)\n?(?<!-)\[_\]")
+EQUATION_AFTER_RE = re.compile(r"\[_\]([.,;])?\n(?!(?:\d+\.|-))(\S)")
 
 
 def select_file(file_path: Optional[str] = None) -> Path:
@@ -98,7 +95,10 @@ def select_file(file_path: Optional[str] = None) -> Path:
         SystemExit: If no file selected or file picker not available
     """
     if not file_path:
-        if not HAS_FILE_PICKER:
+        # Imported only here so command-line runs never load the picker
+        try:
+            import pyle_manager  # type: ignore
+        except ImportError:
             logger.error("File picker not available. Please provide file path via -c option.")
             sys.exit(1)
 
@@ -153,54 +153,40 @@ def process_document(env: Environment) -> None:
         env: Processing environment containing source and output
     """
     # Find \begin{document} and skip preamble
-    if "\\begin{document}" not in env.source.head._text:
+    if not env.source.try_move_index("\\begin{document}"):
         logger.warning("\\begin{document} not found - processing entire file")
-    else:
-        try:
-            env.source.move_index("\\begin{document}")
-        except ValueError:
-            logger.warning("Could not skip to \\begin{document}")
 
-    # Main parsing loop
+    # Bound once: handlers never swap the output buffer mid-document
+    clean_add = env.clean.add
+
+    # Main parsing loop, reading the head buffer by offset rather than through
+    # Source.text so only the emitted text is ever sliced
     while env.source.head:
-        next_index = env.source.inter
+        head = env.source.head
+        s, i = head._text, head._index
+        next_index = head.inter
 
         if next_index == -1:
             # No more special characters - add remaining text and pop stack
-            env.clean.add(env.source.text)
+            clean_add(s[i:])
             env.source.pop()
             continue
 
-        # Add text before special character
-        env.clean.add(env.source.text[:next_index])
-        env.source.index += next_index
+        # Add text before special character (none if it is right here)
+        if next_index:
+            i += next_index
+            clean_add(s[head._index : i])
+            head.index = i
 
         # Process special character
-        char = env.source.text[0]
-
-        match char:
-            case "\\":  # LaTeX command
-                handle_command(env)
-
-            case "$":  # Math mode
-                handle_math_mode(env)
-
-            case "%":  # Comment
-                env.source.move_index("\n")
-
-            case "{" | "}":  # Brackets - skip
-                env.source.index += 1
-
-            case "~":  # Non-breaking space
-                env.clean.add(" ")
-                env.source.index += 1
-
-            case _:  # Unknown special character
-                logger.warning(
-                    "Unknown special character: '%s' at index %d",
-                    char, env.source.index
-                )
-                env.source.index += 1
+        handler = _HANDLERS.get(s[i])
+        if handler is None:  # Unknown special character
+            logger.warning(
+                "Unknown special character: '%s' at index %d", s[i], i
+            )
+            head.index = i + 1
+        else:
+            handler(env)
 
 
 def handle_command(env: Environment) -> None:
@@ -209,20 +195,20 @@ def handle_command(env: Environment) -> None:
     Args:
         env: Processing environment
     """
+    head = env.source.head
+    s, start = head._text, head._index
+
     # Find command terminator
-    terminators = [
-        pos for pos in (env.source.text.find(t, 1) for t in COMMAND_TERMINATORS)
-        if pos > 0
-    ]
+    match = CMD_TERM_RE.search(s, start + 1)
 
-    if not terminators:
+    if match is None:
         logger.warning("No command terminator found after backslash")
-        env.source.index += 1
+        head.index = start + 1
         return
 
-    i = min(terminators)
-    env.command = env.source.text[1:i]
-    env.source.index += i
+    i = match.start()
+    env.command = s[start + 1 : i]
+    head.index = i
 
     # Dispatch to command handler
     interpret(env)
@@ -238,19 +224,72 @@ def handle_math_mode(env: Environment) -> None:
     env.source.index += 1
 
     # Check for display math ($$)
-    if env.source.text and env.source.text[0] == "$":
-        try:
-            env.source.move_index("$$")
-        except ValueError:
+    if env.source.peek() == "$":
+        if not env.source.try_move_index("$$"):
             logger.warning("Unclosed display math mode ($$)")
     else:
         # Inline math mode
-        try:
-            env.source.move_index("$")
-        except ValueError:
+        if not env.source.try_move_index("$"):
             logger.warning("Unclosed inline math mode ($)")
 
 
+def _handle_comment(env: Environment) -> None:
+    """Skip a comment up to and including the end of its line.
+
+    Args:
+        env: Processing environment
+    """
+    env.source.move_index("\n")
+
+
+def _skip_char(env: Environment) -> None:
+    """Skip a grouping bracket without emitting anything.
+
+    Args:
+        env: Processing environment
+    """
+    env.source.index += 1
+
+
+def _handle_tilde(env: Environment) -> None:
+    """Replace a non-breaking space with a plain space.
+
+    Args:
+        env: Processing environment
+    """
+    env.clean.add(" ")
+    env.source.index += 1
+
+
+# Special character -> handler, looked up once per special character
+_HANDLERS = {
+    "\\": handle_command,  # LaTeX command
+    "$": handle_math_mode,  # Math mode
+    "%": _handle_comment,  # Comment
+    "{": _skip_char,  # Brackets - skip
+    "}": _skip_char,
+    "~": _handle_tilde,  # Non-breaking space
+}
+
+
+
+def _collapse_whitespace(match: re.Match) -> str:
+    """Normalize one run of two or more whitespace characters.
+
+    Args:
+        match: Match covering a maximal whitespace run
+
+    Returns:
+        The run with spaces around newlines dropped, newlines capped at two
+        and repeated spaces collapsed
+    """
+    run = match.group()
+    if "\n" not in run:
+        return DOUBLE_SPACING_RE.sub(" ", run)
+    run = TRAILING_SPACES_RE.sub("\n", run)
+    run = EXCESS_NEWLINES_RE.sub("\n\n", run)
+    return DOUBLE_SPACING_RE.sub(" ", run)
+
 
 def post_process(text: str) -> str:
     """Apply regex-based cleanup to processed text.
@@ -265,22 +304,19 @@ def post_process(text: str) -> str:
     text = text.strip()
 
     # Remove empty brackets and tabs
-    text = text.replace("[]", "").replace("()", "").replace("\t", " ")
-
-    # Normalize whitespace around newlines
-    text = REGEX_PATTERNS['trailing_spaces'].sub("\n", text)
+    text = EMPTY_BRACKETS_RE.sub("", text).replace("\t", " ")
 
-    # Remove excess newlines (max 2 consecutive)
-    text = REGEX_PATTERNS['excess_newlines'].sub("\n\n", text)
-
-    # Remove double spacing
-    text = REGEX_PATTERNS['double_spacing'].sub(" ", text)
+    # Normalize whitespace around newlines, cap consecutive newlines at two and
+    # collapse double spacing. These rules only ever rewrite characters inside a
+    # whitespace run, so one pass over the runs that can change replaces three
+    # passes over the whole document
+    text = WHITESPACE_RUN_RE.sub(_collapse_whitespace, text)
 
     # Format [_] spacing before equations (unless preceded by -)
-    text = REGEX_PATTERNS['equation_before'].sub(r"\1 [_]", text)
+    text = EQUATION_BEFORE_RE.sub(r"\1 [_]", text)
 
     # Format [_] spacing after equations (unless followed by list item)
-    text = REGEX_PATTERNS['equation_after'].sub(r"[_]\1 \2", text)
+    text = EQUATION_AFTER_RE.sub(r"[_]\1 \2", text)
 
     return text
 
@@ -297,7 +333,9 @@ def write_output_files(env: Environment, base_filename: str, output_dir: Path) -
     output_file = output_dir / f"{base_filename}_grammafied.txt"
     try:
         with open(output_file, "w", encoding="utf-8") as f:
-            f.write(env.clean.text)
+            # Stream in slices so only one slice is ever encoded at a time
+            for chunk in env.clean.iter_chunks():
+                f.write(chunk)
         logger.info("Successfully wrote: %s", output_file)
     except IOError as e:
         logger.error("Failed to write output file: %s", e)
@@ -309,13 +347,38 @@ def write_output_files(env: Environment, base_filename: str, output_dir: Path) -
         try:
             with open(unknowns_file, "w", encoding="utf-8") as f:
                 f.write("Unknown LaTeX commands encountered:\n\n")
-                for cmd in sorted(env.clean.aggro):
-                    f.write(f"  \\{cmd}\n")
+                f.writelines(f"  \\{cmd}\n" for cmd in sorted(env.clean.aggro))
             logger.warning("Unknown commands found. See: %s", unknowns_file)
         except IOError as e:
             logger.error("Failed to write unknowns file: %s", e)
 
 
+def convert_file(input_file: Path) -> None:
+    """Convert an already validated LaTeX file and write its output files.
+
+    Args:
+        input_file: Path to an existing LaTeX file
+    """
+    logger.info("Processing: %s", input_file)
+
+    # Initialize environment
+    env = Environment(input_file)
+
+    # Process document
+    logger.info("Parsing LaTeX document...")
+    process_document(env)
+
+    # Post-process
+    logger.info("Applying post-processing cleanup...")
+    env.clean.text = post_process(env.clean.text)
+
+    # Write output
+    base_filename = get_output_filename(input_file)
+    write_output_files(env, base_filename, env.folder_path)
+
+    logger.info("Grammification complete!")
+
+
 def grammafy(file_path: Optional[str] = None) -> None:
     """Main function to convert LaTeX file to clean text.
 
@@ -335,24 +398,9 @@ def grammafy(file_path: Optional[str] = None) -> None:
     try:
         # Step 1: Select input file
         input_file = select_file(file_path)
-        logger.info("Processing: %s", input_file)
-
-        # Step 2: Initialize environment
-        env = Environment(input_file)
-
-        # Step 3: Process document
-        logger.info("Parsing LaTeX document...")
-        process_document(env)
-
-        # Step 4: Post-process
-        logger.info("Applying post-processing cleanup...")
-        env.clean.text = post_process(env.clean.text)
-
-        # Step 5: Write output
-        base_filename = get_output_filename(input_file)
-        write_output_files(env, base_filename, env.folder_path)
 
-        logger.info("Grammification complete!")
+        # Steps 2-5: Parse, clean up and write output
+        convert_file(input_file)
 
     except KeyboardInterrupt:
         logger.info("\nOperation cancelled by user")
@@ -362,18 +410,106 @@ def grammafy(file_path: Optional[str] = None) -> None:
         sys.exit(1)
 
 
+def _init_worker(log_level: int) -> None:
+    """Configure logging in a batch worker process.
+
+    Args:
+        log_level: Logging level chosen on the command line
+    """
+    logging.basicConfig(level=log_level, format=LOG_FORMAT)
+
+
+def grammafy_batch(
+    file_paths: list[str], jobs: Optional[int] = None, log_level: int = logging.INFO
+) -> None:
+    """Convert several LaTeX files concurrently, one worker process per file.
+
+    Files are independent, so they are spread over a process pool; processes
+    rather than threads because parsing and post-processing are CPU-bound
+    Python code. Paths are validated here first, since workers have no
+    terminal to ask about non-.tex files on.
+
+    Args:
+        file_paths: Paths of the LaTeX files to convert
+        jobs: Maximum number of worker processes (defaults to the CPU count)
+        log_level: Logging level to use in the workers
+
+    Raises:
+        SystemExit: If any file fails, once all the others have finished
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    input_files = []
+    failed = []
+    for file_path in file_paths:
+        try:
+            input_files.append(select_file(file_path))
+        except SystemExit as e:
+            # Non-zero: file not found; zero: user declined a non-.tex file
+            if e.code:
+                failed.append(file_path)
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(log_level,)
+    ) as pool:
+        futures = {pool.submit(convert_file, path): path for path in input_files}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except (SystemExit, Exception) as e:
+                logger.error(
+                    "Failed to process %s: %s", futures[future], e, exc_info=True
+                )
+                failed.append(str(futures[future]))
+
+    if failed:
+        logger.error(
+            "%d of %d files failed: %s", len(failed), len(file_paths), ", ".join(failed)
+        )
+        sys.exit(1)
+
+
 def main() -> None:
     """Entry point for command-line usage."""
+    if getattr(sys, "frozen", False):
+        # Batch workers re-enter main() in PyInstaller builds
+        import multiprocessing
+        multiprocessing.freeze_support()
+
+    # Fast path for the common "grammafy FILE" and "grammafy -c FILE" calls:
+    # nothing else to parse, so skip importing argparse and building the parser
+    argv = sys.argv[1:]
+    if len(argv) == 2 and argv[0] in ("-c", "--commandline"):
+        argv = argv[1:]
+    if len(argv) == 1 and not argv[0].startswith("-"):
+        logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+        grammafy(argv[0])
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="grammafy",
         description="Convert LaTeX files to clean text for grammar checking",
         epilog="Example: grammafy -c document.tex"
     )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        metavar="FILE",
+        help="Additional LaTeX files; several files are processed in parallel"
+    )
     parser.add_argument(
         "-c", "--commandline",
         metavar="FILE",
         help="LaTeX file to process (if not provided, use interactive picker)"
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        metavar="N",
+        help="Number of files to process at once (default: number of CPUs)"
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -386,14 +522,23 @@ def main() -> None:
     )
 
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     # Configure logging level
     if args.quiet:
-        logging.getLogger().setLevel(logging.ERROR)
+        level = logging.ERROR
     elif args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+        level = logging.DEBUG
+    else:
+        level = logging.INFO
+    logging.basicConfig(level=level, format=LOG_FORMAT)
 
-    grammafy(args.commandline)
+    files = ([args.commandline] if args.commandline else []) + args.files
+    if len(files) > 1:
+        grammafy_batch(files, args.jobs, level)
+    else:
+        grammafy(files[0] if files else None)
 
 
 if __name__ == "__main__":